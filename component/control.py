@@ -1,7 +1,7 @@
 import system.component as sys_component
 
 class Control(sys_component.Component):
-    pass
+    __slots__ = ()
 class Control2():
     pass
 class Control3():
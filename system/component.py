@@ -1,6 +1,7 @@
 import utils.node_wrapper as nw
 import system.component_data as component_data
 import system.component_enum as component_enum
+import functools
 import re
 
 import utils.utils as utils
@@ -11,43 +12,38 @@ def get_component(container_node):
     if container_node is None:
         return None
     if container_node.has_attr("componentClass"):
-        component_class = utils.string_to_class(container_node["componentClass"].value)
+        class_str = container_node["componentClass"].value
+        component_class = Component._registry.get(class_str)
+        if component_class is None:
+            component_class = utils.string_to_class(class_str)
         return component_class(container_node)
     
-def control_setup_node(name="controlSetup") -> nw.Node:
+@functools.lru_cache(maxsize=None)
+def _get_control_class_enum_name():
+    # control classes are fixed once the module is loaded
     import component.control as control
+    return ":".join(utils.get_classes_from_package(control))
+
+def control_setup_node(name="controlSetup") -> nw.Node:
     control_setup_node = nw.create_node("network", name)
 
-    setup_node_data = component_data.NodeData(
-        component_data.AttrData(attr_name="controlClass", attr_type="enum", enum_name=":".join(utils.get_classes_from_package(control))),
+    setup_attr_data = [
+        component_data.AttrData(attr_name="controlClass", attr_type="enum", enum_name=_get_control_class_enum_name()),
         component_data.AttrData(attr_name="instanceName", attr_type="string"),
         component_data.AttrData(attr_name="shapeColor", attr_type="enum", enum_name=component_enum.Colors.maya_enum_str()),
         component_data.AttrData(attr_name="attrs", attr_type="string", multi=True),
         component_data.AttrData(attr_name="lockAttrs", attr_type="compound"),
         component_data.AttrData(attr_name="lockDefaultAttrs", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockTX", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockTY", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockTZ", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockRX", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockRY", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockRZ", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockSX", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockSY", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockSZ", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="lockVis", attr_type="bool", parent="lockAttrs"),
-        component_data.AttrData(attr_name="buildTranslate", attr_type="double3"),
-        component_data.AttrData(attr_name="buildTranslateX", attr_type="double", parent="buildTranslate"),
-        component_data.AttrData(attr_name="buildTranslateY", attr_type="double", parent="buildTranslate"),
-        component_data.AttrData(attr_name="buildTranslateZ", attr_type="double", parent="buildTranslate"),
-        component_data.AttrData(attr_name="buildRotate", attr_type="double3"),
-        component_data.AttrData(attr_name="buildRotateX", attr_type="double", parent="buildRotate"),
-        component_data.AttrData(attr_name="buildRotateY", attr_type="double", parent="buildRotate"),
-        component_data.AttrData(attr_name="buildRotateZ", attr_type="double", parent="buildRotate"),
-        component_data.AttrData(attr_name="buildScale", attr_type="double3"),
-        component_data.AttrData(attr_name="buildScaleX", attr_type="double", parent="buildScale"),
-        component_data.AttrData(attr_name="buildScaleY", attr_type="double", parent="buildScale"),
-        component_data.AttrData(attr_name="buildScaleZ", attr_type="double", parent="buildScale"),
-    )
+    ]
+    # lockTX, lockTY ... lockSZ
+    setup_attr_data.extend([component_data.AttrData(attr_name=f"lock{attr}{axis}", attr_type="bool", parent="lockAttrs") for attr in "TRS" for axis in "XYZ"])
+    setup_attr_data.append(component_data.AttrData(attr_name="lockVis", attr_type="bool", parent="lockAttrs"))
+    # buildTranslate, buildRotate, buildScale and their X, Y, Z children
+    for build_attr in ("buildTranslate", "buildRotate", "buildScale"):
+        setup_attr_data.append(component_data.AttrData(attr_name=build_attr, attr_type="double3"))
+        setup_attr_data.extend([component_data.AttrData(attr_name=f"{build_attr}{axis}", attr_type="double", parent=build_attr) for axis in "XYZ"])
+
+    setup_node_data = component_data.NodeData(*setup_attr_data)
     setup_node_data.add_attr_data_attributes(control_setup_node)
 
     return control_setup_node
@@ -68,30 +64,37 @@ class KwargToNode():
     @classmethod
     def set_node_attrs(cls, node, **attr_kwargs):
         filtered_dict = cls._modify_attr_kwargs(attr_kwargs)
+        missing_keys = []
 
         for key in filtered_dict:
-            if not node.has_attr(key):
-                cmds.warning(f"{node}.{key} attr does not exist")
+            # single lookup instead of has_attr followed by another getitem
+            try:
+                attr = node[key]
+            except RuntimeError:
+                missing_keys.append(key)
                 continue
             dict_value = filtered_dict[key]
             if dict_value is not None:
                 if isinstance(dict_value, nw.Attr):
-                    dict_value >> node[key]
+                    dict_value >> attr
                 else:
-                    node[key].set(cls._modify_attr_kwarg_value(dict_value))
+                    attr.set(cls._modify_attr_kwarg_value(dict_value))
+
+        if missing_keys:
+            cmds.warning(f"{node} attrs do not exist: {', '.join(missing_keys)}")
     @classmethod
     def _modify_attr_kwargs(cls, attr_kwargs:dict):
         return_dict = {}
+        pop_attr_kwarg = attr_kwargs.popitem
+        modify_attr_kwarg_key = cls._modify_attr_kwarg_key
 
         # while there's still items in attr_kwargs
-        while(len(attr_kwargs) > 0):
-            item = attr_kwargs.popitem()
-            key = item[0]
-            data = item[1]
+        while attr_kwargs:
+            key, data = pop_attr_kwarg()
             
             if isinstance(data, dict):
-                for data_key in data:
-                    attr_kwargs[f"{key}__{data_key}"] = data[data_key]
+                for data_key, sub_data in data.items():
+                    attr_kwargs[f"{key}__{data_key}"] = sub_data
 
             elif isinstance(data, list):
                 for index, sub_data in enumerate(data):
@@ -99,7 +102,7 @@ class KwargToNode():
 
             else:
                 # modified keys
-                new_key = cls._modify_attr_kwarg_key(key)
+                new_key = modify_attr_kwarg_key(key)
                 # modify values 
                 return_dict[new_key] = data
 
@@ -110,12 +113,12 @@ class KwargToNode():
     
         # Use re.split to split by the pattern and keep the delimiters (numbers)
         key = utils.snake_to_camel(key)
-        return_key = [part for part in re.split(pattern, key) if part not in  ("__", "")]
+        return_key = (part for part in re.split(pattern, key) if part not in  ("__", ""))
         # return_key = [utils.snake_to_camel(part) for part in return_key]
         
-        new_return_key = [return_key[0]]
-        new_return_key.extend([f"[{utils.uncapitalize(part)}]" for part in return_key[1:]])
-        new_return_key = "".join(new_return_key)
+        # first part is the attr name, every other part is an index or child attr
+        new_return_key = next(return_key)
+        new_return_key += "".join(f"[{utils.uncapitalize(part)}]" for part in return_key)
 
         return new_return_key
 
@@ -126,33 +129,45 @@ class Component():
     class_namespace = "component"
     has_hier_attrs = False
 
+    __slots__ = ("parent_container_node", "__container_node", "__input_node", "__output_node", "__namespace_cache")
+
+    # class str -> component class, filled in as subclasses are defined
+    _registry = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._register_class()
+
+    @classmethod
+    def _register_class(cls):
+        # class name only depends on the class so it's resolved once here
+        cls.class_name = utils.class_type_to_str(cls)
+        Component._registry[cls.class_name] = cls
+
     def __init__(self, container_node=None, parent_container_node=None):
         # self.container_node = container_node
         self.parent_container_node = parent_container_node
-        self.__node_data_cache = {}
+        self.__container_node = container_node
+        self.__input_node = None
+        self.__output_node = None
         self.__namespace_cache = {"full_namespace":"", "short_namespace":"", "instance_namespace":"", "hier_side":"", "instance_name":""}
-        self.class_name = utils.class_type_to_str(type(self))
-        if container_node is not None:
-            self.__node_data_cache["container_node"] = container_node
-    def __get_node_data_from_cache(self, key):
-        if key not in self.__node_data_cache.keys():
-            self.__node_data_cache[key] = utils.get_first_connected_node(self.container_node[key], as_source=True)
-        
-        return self.__node_data_cache[key]
+    def __get_mapped_node(self, key):
+        return utils.get_first_connected_node(self.__container_node[key], as_source=True)
 
     # node attr
     @property 
     def container_node(self)->nw.Container:
-        if "container_node" in self.__node_data_cache.keys():
-            return self.__node_data_cache["container_node"]
+        return self.__container_node
     @property 
     def input_node(self)->nw.Node:
-        if self.container_node is not None:
-            return self.__get_node_data_from_cache("input_node")
+        if self.__input_node is None and self.__container_node is not None:
+            self.__input_node = self.__get_mapped_node("input_node")
+        return self.__input_node
     @property 
     def output_node(self)->nw.Node:
-        if self.container_node is not None:
-            return self.__get_node_data_from_cache("output_node")
+        if self.__output_node is None and self.__container_node is not None:
+            self.__output_node = self.__get_mapped_node("output_node")
+        return self.__output_node
     @property 
     def transform_node(self)->nw.Node:
         if type(self).root_transform_name is not None:
@@ -173,8 +188,9 @@ class Component():
         return self.__namespace_cache["instance_namespace"]
     def __update_full_namespace(self):
         parent_container = None
-        if self.container_node is not None:
-            parent_container = self.container_node.get_container_node()
+        container_node = self.container_node
+        if container_node is not None:
+            parent_container = container_node.get_container_node()
         short_namespace = self.short_namespace
         full_namespace = ""
         cached_full_namespace = self.__namespace_cache["full_namespace"]
@@ -184,49 +200,54 @@ class Component():
         else:
             parent_namespace = utils.Namespace.get_namespace(str(parent_container))
             if cached_full_namespace.find(parent_namespace) != 0:
-                full_namespace = f"{utils.Namespace.get_namespace(str(parent_container))}:{short_namespace}"
+                full_namespace = f"{parent_namespace}:{short_namespace}"
             else:
                 cached_full_namespace = cached_full_namespace.replace(parent_namespace, "", 1)
                 if cached_full_namespace.find(short_namespace) != 1:
-                    full_namespace = f"{utils.Namespace.get_namespace(str(parent_container))}:{short_namespace}"
+                    full_namespace = f"{parent_namespace}:{short_namespace}"
                     
         if full_namespace != "":
             self.__namespace_cache["full_namespace"] = full_namespace
     def __update_short_namespace(self):
         instance_namespace = self.instance_namespace
+        class_namespace = type(self).class_namespace
         short_namespace = ""
 
-        if instance_namespace is not None and instance_namespace != "":
-            if not self.__namespace_cache["short_namespace"].startswith(f"{instance_namespace}__"):
-                short_namespace = f"{instance_namespace}__{type(self).class_namespace}"
+        cached_short_namespace = self.__namespace_cache["short_namespace"]
+
+        if instance_namespace:
+            if not cached_short_namespace.startswith(f"{instance_namespace}__"):
+                short_namespace = f"{instance_namespace}__{class_namespace}"
         else:
-            if self.__namespace_cache["short_namespace"] != type(self).class_namespace:
-                short_namespace = type(self).class_namespace
+            if cached_short_namespace != class_namespace:
+                short_namespace = class_namespace
 
         if short_namespace != "":
             self.__namespace_cache["short_namespace"] = short_namespace
     def __update_instance_namespace(self):
         instance_namespace = ""
 
-        if self.input_node is None:
+        input_node = self.input_node
+        if input_node is None:
             return
 
         side = None
-        if self.input_node.has_attr("hierSide"):
-            side = self.input_node["hierSide"].value
+        if input_node.has_attr("hierSide"):
+            side = input_node["hierSide"].value
             if side != self.__namespace_cache["hier_side"]:
                 self.__namespace_cache["hier_side"] = side
                 
-                if side is not None and side != "":
+                # side is an enum index so 0 is still a valid side
+                if side not in (None, ""):
                     instance_namespace = f"{component_enum.CharacterSide.get(side).value}_"
 
         instance_name = None
-        if self.input_node.has_attr("instanceName"):
-            instance_name = self.input_node["instanceName"].value
+        if input_node.has_attr("instanceName"):
+            instance_name = input_node["instanceName"].value
             if instance_name != self.__namespace_cache["instance_name"]:
                 self.__namespace_cache["instance_name"] = instance_name
                 
-                if instance_name is not None and instance_name!= "":
+                if instance_name:
                     instance_namespace = f"{instance_namespace}{instance_name}"
 
         if instance_namespace != "":
@@ -234,20 +255,23 @@ class Component():
 
     # node add attr data
     def _get_input_node_attr_data(self) -> component_data.NodeData:
+        cls = type(self)
         node_data =  component_data.NodeData(
             component_data.AttrData(attr_name="input", attr_type="compound", attr_publish=True),
             component_data.AttrData(attr_name="buildData", attr_type="compound", attr_publish=True),
             component_data.AttrData(attr_name="componentClass", attr_type="string", attr_value=self.class_name, attr_locked=True, parent="buildData"),
-            component_data.AttrData(attr_name="componentType", attr_type=type(self).component_type, attr_locked=True, parent="buildData"),
+            component_data.AttrData(attr_name="componentType", attr_type=cls.component_type, attr_locked=True, parent="buildData"),
             component_data.AttrData(attr_name="instanceName", attr_type="string", parent="buildData"),
         )
-        if type(self).root_transform_name is not None:
-            node_data.extend_attr_data(
+        extra_attr_data = []
+        if cls.root_transform_name is not None:
+            extra_attr_data.extend((
                 component_data.AttrData(attr_name="offsetParentMatrix", attr_publish="offsetMatrix"),
                 component_data.AttrData(attr_name="worldMatrix[0]", attr_publish="worldMatrix"),
-            )
-        if type(self).has_hier_attrs:
-            node_data.extend_attr_data(component_data.HierData.get_input_attr_data())
+            ))
+        if cls.has_hier_attrs:
+            extra_attr_data.append(component_data.HierData.get_input_attr_data())
+        node_data.extend_attr_data(*extra_attr_data)
         return node_data
     def _get_output_node_attr_data(self) -> component_data.NodeData:
         node_data = component_data.NodeData(
@@ -273,9 +297,11 @@ class Component():
         if type(self).has_hier_attrs:
             self.xform_override_function()
     def __create_base_nodes(self):
+        root_transform_name = type(self).root_transform_name
+
         # input node
-        if type(self).root_transform_name is not None:
-            input_node = nw.create_node("transform", type(self).root_transform_name)
+        if root_transform_name is not None:
+            input_node = nw.create_node("transform", root_transform_name)
         else:
             input_node = nw.create_node("network", "input")
         input_node_attr_data = self._get_input_node_attr_data()
@@ -286,15 +312,15 @@ class Component():
         has_output_node = len(output_node_attr_data.node_attr_list) > 1
         if has_output_node:
             output_node = nw.create_node("network", "output")
-            output_node_attr_data = self._get_output_node_attr_data()
             output_node_attr_data.add_attr_data_attributes(output_node)
 
         # container node
-        self.__node_data_cache["container_node"] = nw.create_node("container", "component_container")
+        container_node = nw.create_node("container", "component_container")
+        self.__container_node = container_node
         container_node_attr_data = self._get_container_node_attr_data()
-        container_node_attr_data.add_attr_data_attributes(self.container_node)
+        container_node_attr_data.add_attr_data_attributes(container_node)
         if self.parent_container_node is not None:
-            self.parent_container_node.add_nodes(self.container_node)
+            self.parent_container_node.add_nodes(container_node)
 
         # add to container -> map to container -> publish attributes
         # if output
@@ -302,7 +328,7 @@ class Component():
         if has_output_node:
             component_nodes.append(output_node)
 
-        self.container_node.add_nodes(*component_nodes)
+        container_node.add_nodes(*component_nodes)
 
         utils.map_to_container(input_node, node_message_name="input_node")
         if has_output_node:
@@ -311,14 +337,22 @@ class Component():
             output_node_attr_data.publish_attr_data_attributes(output_node)
         
         input_node_attr_data.publish_attr_data_attributes(input_node)
-        container_node_attr_data.publish_attr_data_attributes(self.container_node)
+        container_node_attr_data.publish_attr_data_attributes(container_node)
 
         # renaming to nodes
         self.rename_nodes()
     def xform_override_function(self):
-        for index, attr in enumerate(self.input_node[component_data.HierData.input_xform]):
-            attr[component_data.HierData.input_xform_name] >> self.output_node[component_data.HierData.output_xform][index][component_data.HierData.output_xform_name]
-            attr[component_data.HierData.input_init_matrix] >> self.output_node[component_data.HierData.output_xform][index][component_data.HierData.output_init_matrix]
+        hier_data = component_data.HierData
+        input_xform_name, input_init_matrix = hier_data.input_xform_name, hier_data.input_init_matrix
+        output_xform_name, output_init_matrix = hier_data.output_xform_name, hier_data.output_init_matrix
+
+        output_xforms = self.output_node[hier_data.output_xform]
+        connections = []
+        for index, attr in enumerate(self.input_node[hier_data.input_xform]):
+            output_xform = output_xforms[index]
+            connections.append((attr[input_xform_name], output_xform[output_xform_name]))
+            connections.append((attr[input_init_matrix], output_xform[output_init_matrix]))
+        nw.connect_attrs(connections)
     
     # other functions
     def insert_component(self, component, parent_transform = None, **component_kwargs):
@@ -340,32 +374,40 @@ class Component():
             if not node.name.startswith(full_namespace):
                 strip_namespace_node = utils.Namespace.strip_namespace(str(node))
                 node.rename(f"{full_namespace}:{strip_namespace_node}")
+        container_node = self.container_node
         full_namespace = self.full_namespace
-        prev_namespace = utils.Namespace.get_namespace(self.container_node.name)
+        prev_namespace = utils.Namespace.get_namespace(container_node.name)
 
         # if you need to add the namespace
         if not utils.Namespace.equal_namespace(full_namespace, prev_namespace):
             # if namespace doesn't exist
             if utils.Namespace.exists(full_namespace):
                 parent_namespace = utils.Namespace.get_namespace(full_namespace)
-                child_namespaces = [utils.Namespace.strip_namespace(x) for x in utils.Namespace.child_namespaces(parent_namespace)]
                 # add something to instance namespace if it's none
-                if self.input_node["instanceName"].value == "" or self.input_node["instanceName"].value is None:
-                    self.input_node["instanceName"] = "temp"
+                instance_name_attr = self.input_node["instanceName"]
+                instance_name = instance_name_attr.value
+                if instance_name == "" or instance_name is None:
+                    instance_name = "temp"
+                    instance_name_attr.set(instance_name)
                 # getting just the instance_namespace portion of children namespaces
-                child_namespaces = [x.split("__", 1)[0] for x in child_namespaces if x.startswith(utils.strip_trailing_numbers(self.instance_namespace))]
+                instance_prefix = utils.strip_trailing_numbers(self.instance_namespace)
+                child_namespaces = []
+                for child_namespace in utils.Namespace.child_namespaces(parent_namespace):
+                    child_namespace = utils.Namespace.strip_namespace(child_namespace)
+                    if child_namespace.startswith(instance_prefix):
+                        child_namespaces.append(child_namespace.split("__", 1)[0])
                 if child_namespaces != []:
                     highest_trailing_number = utils.get_max_trailing_numbers(child_namespaces)
-                    instance_name = utils.strip_trailing_numbers(self.input_node["instanceName"].value)
-                    self.input_node["instanceName"] = f"{instance_name}{int(highest_trailing_number + 1)}"
+                    instance_name = utils.strip_trailing_numbers(instance_name)
+                    instance_name_attr.set(f"{instance_name}{int(highest_trailing_number + 1)}")
 
                 # give it a unique namespace by giving instance_namespace a new value
                 full_namespace = self.full_namespace
             
             utils.Namespace.add_namespace(full_namespace)
 
-        rename_node(self.container_node, full_namespace)
-        for node in self.container_node.get_nodes():
+        rename_node(container_node, full_namespace)
+        for node in container_node.get_nodes():
             # TODO replace later with if it's a component not just a container
             if node.node_type != "container":
                 rename_node(node, full_namespace)
@@ -388,3 +430,6 @@ class Component():
         # re publish if needs be
 
         
+
+# the base class isn't passed through __init_subclass__
+Component._register_class()
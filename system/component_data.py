@@ -8,11 +8,14 @@ class NodeData(list):
         self.extend_attr_data(*args)
 
     def extend_attr_data(self, *args):
-        if len(args) > 0 and isinstance(args[0], NodeData):
-            args = args[0].node_attr_list
-        else:
-            args = [data for data in args if isinstance(data, AttrData)]
-        self.node_attr_list.extend(args)
+        # args can mix AttrData and NodeData, NodeData is flattened in place
+        attr_data_list = []
+        for data in args:
+            if isinstance(data, NodeData):
+                attr_data_list.extend(data.node_attr_list)
+            elif isinstance(data, AttrData):
+                attr_data_list.append(data)
+        self.node_attr_list.extend(attr_data_list)
 
     def add_attr_data_attributes(self, node:nw.Node):
         # adding attrs
@@ -20,27 +23,34 @@ class NodeData(list):
 
         for data in self.node_attr_list:
             if data.do_add_attr:
+                data_name = data.name
+                num_children = num_children_dict.get(data_name)
 
-                if data.name in num_children_dict.keys():
-                    data.add_attr_kwargs["numberOfChildren"] = num_children_dict[data.name]
+                if num_children is not None:
+                    data.add_attr_kwargs["numberOfChildren"] = num_children
 
-                if data.type == "compound" and not data.name in num_children_dict.keys():
+                elif data.type == "compound":
                     continue
 
-                node.add_attr(long_name=data.name, type=data.type, **data.add_attr_kwargs)
+                node.add_attr(long_name=data_name, type=data.type, **data.add_attr_kwargs)
 
         # setting attrs and locking
         for data in self.node_attr_list:
+            data_value = data.value
+            if data_value is None and not data.locked:
+                continue
+            attr = node[data.name]
+
             # dealing with attr value
-            if data.value is not None:
-                if isinstance(data.value, nw.Attr):
-                    data.value >> node[data.name]
+            if data_value is not None:
+                if isinstance(data_value, nw.Attr):
+                    data_value >> attr
                 else:
-                    node[data.name] = data.value
+                    attr.set(data_value)
 
             # locking
             if data.locked:
-                node[data.name].set_locked(True)
+                attr.set_locked(True)
 
     def publish_attr_data_attributes(self, node:nw.Node):
         container_node = node.get_container_node()
@@ -59,12 +69,9 @@ class NodeData(list):
         num_children_dict = {}
         for data in self.node_attr_list:
             attr_kwargs = data.add_attr_kwargs
-            if "parent" in attr_kwargs.keys():
+            if "parent" in attr_kwargs:
                 parent_name = attr_kwargs["parent"]
-                if parent_name not in num_children_dict.keys():
-                    num_children_dict[parent_name] = 1
-                else:
-                    num_children_dict[parent_name] = num_children_dict[parent_name] + 1
+                num_children_dict[parent_name] = num_children_dict.get(parent_name, 0) + 1
 
         return num_children_dict
 
@@ -1,5 +1,7 @@
 from enum import Enum
+import functools
 import maya.cmds as cmds
+import sys
 # import maya.api.OpenMaya as om2
 import utils.node_wrapper as nw
 import utils.utils as utils
@@ -17,17 +19,17 @@ class MayaEnumAttr(Enum):
     
     @classmethod
     def get(cls, index):
-        for i, curr_enum in enumerate(cls):
-            if i == index:
-                return curr_enum
+        member_names = cls._member_names_
+        # Attr.value hands back numeric plugs as floats
+        if isinstance(index, (int, float)) and float(index).is_integer():
+            index = int(index)
+            if 0 <= index < len(member_names):
+                return cls[member_names[index]]
             
     @classmethod
     def index_of(cls, enum):
-        index = 0
-        for item in cls:
-            if item == enum:
-                return index
-            index += 1
+        if isinstance(enum, cls):
+            return cls._member_names_.index(enum.name)
     
     @ classmethod
     def get_enum_dict(cls):
@@ -38,27 +40,15 @@ class MayaEnumAttr(Enum):
     def create_remap(cls, node_name, enum_dict=None):
         if enum_dict is None:
             enum_dict = cls.get_enum_dict()
-        out_min = 0
-        out_max = 0
+        enum_values = list(enum_dict.values())
+        if not all(isinstance(value, (int, float)) for value in enum_values):
+            cmds.error("enum does not have numeric values")
 
-        for key in enum_dict:
-            value = enum_dict[key]
-            if not isinstance(value, int) and isinstance(value, float):
-                cmds.error("enum does not have numeric values")
-            out_min = value
-            out_max = value
-            break
-            
-
-        # find max
-        for key in enum_dict:
-            value = enum_dict[key]
-            if value < out_min:
-                out_min = value
-            if value > out_max:
-                out_max = value
+        # find min and max
+        out_min = min(enum_values, default=0)
+        out_max = max(enum_values, default=0)
 
-        map_len = len(enum_dict.keys())
+        map_len = len(enum_dict)
         interval_len = 1.0/float(map_len-1)
         remap_node = nw.Node.create_node("remapValue", node_name)
         remap_node["outputMin"] = out_min
@@ -67,12 +57,15 @@ class MayaEnumAttr(Enum):
         remap_node["inputMax"] = map_len - 1
 
         out_diff = out_max - out_min
-        for index, key in enumerate(enum_dict.keys()):
-            value = enum_dict[key] - out_min
+        value_attr = remap_node["value"]
+        for index, enum_value in enumerate(enum_values):
+            value = enum_value - out_min
 
-            remap_node["value[{}].value_FloatValue".format(index)] = float(value)/out_diff
-            remap_node["value[{}].value_Position".format(index)] = interval_len * index
-            remap_node["value[{}].value_Interp".format(index)] = 1
+            # resolve the element once and set its children through it
+            value_element = value_attr[index]
+            value_element["value_FloatValue"] = float(value)/out_diff
+            value_element["value_Position"] = interval_len * index
+            value_element["value_Interp"] = 1
 
         return remap_node
     
@@ -80,12 +73,20 @@ class MayaEnumAttr(Enum):
     def long_name(cls, item):
         return "utils.enum.{}.{}".format(type(item).__name__, item.name)
     
+@functools.lru_cache(maxsize=None)
+def _get_enum_classes():
+    component_enum = sys.modules[__name__]
+    return tuple(getattr(component_enum, x) for x in utils.get_classes_from_package(component_enum))
+
 def get_enum_item_class(item)->MayaEnumAttr:
-    import system.component_enum as component_enum
-    for curr_enum_class in utils.get_classes_from_package(component_enum):
-        curr_enum_class = getattr(component_enum, curr_enum_class)
-        if isinstance(item, curr_enum_class) or item == curr_enum_class:
-            return curr_enum_class
+    # members map straight to their class and anything that is not a 
+    # class can't be an enum class, so neither needs the class scan
+    if isinstance(item, MayaEnumAttr):
+        return type(item)
+    if not isinstance(item, type):
+        return None
+    if item in _get_enum_classes():
+        return item
 
 def get_index_of_item(item)->int:
     curr_enum_class = get_enum_item_class(item)
@@ -128,46 +129,6 @@ class Colors(MayaEnumAttr):
     red = 13
     yellow = 17
 
-    @classmethod
-    def create_remap(cls, name):
-        enum_dict = cls.get_enum_dict()
-        out_min = 0
-        out_max = 0
-
-        for key in enum_dict:
-            value = enum_dict[key]
-            if not isinstance(value, int) and not isinstance(value, float):
-                cmds.error("enum does not have numeric values")
-            out_min = value
-            out_max = value
-            break
-            
-        # find max
-        for key in enum_dict:
-            value = enum_dict[key]
-            if value < out_min:
-                out_min = value
-            if value > out_max:
-                out_max = value
-
-        map_len = len(enum_dict.keys())
-        interval_len = 1.0/float(map_len-1)
-        remap_node = nw.Node.create_node("remapValue", name)
-        remap_node["outputMin"] = out_min
-        remap_node["outputMax"] = out_max
-
-        remap_node["inputMax"] = map_len - 1
-
-        out_diff = out_max - out_min
-        for index, key in enumerate(enum_dict.keys()):
-            value = enum_dict[key] - out_min
-
-            remap_node["value[{}].value_FloatValue".format(index)] = float(value)/out_diff
-            remap_node["value[{}].value_Position".format(index)] = interval_len * index
-            remap_node["value[{}].value_Interp".format(index)] = 1
-
-        return remap_node
-    
 class CharacterSide(MayaEnumAttr):
     none = "none"
     mid = "M"
@@ -5,6 +5,12 @@ import utils.om as utils_om
 from utils.utils import snake_to_camel
 import utils.apiundo as apiundo
 
+# add_attr type -> the cmds.addAttr flag the type is passed as
+ADD_ATTR_TYPE_FLAGS = {
+    **dict.fromkeys(("string", "nurbsCurve", "nurbsSurface", "mesh", "matrix"), "dataType"),
+    **dict.fromkeys(("compound", "message", "double", "long", "bool", "enum", "double3", "double2"), "attributeType"),
+}
+
 def derive_node(arg):
     node = Node(arg)
     if node.node_type == "container":
@@ -28,6 +34,25 @@ def create_node(node_type:str, name:str=None):
 def exists(node):
     return cmds.objExists(str(node))
 
+def connect_attrs(attr_pairs):
+    """connects every source attr to its destination attr in one 
+    batched DG edit. like >> locked attrs are unlocked for the 
+    connection and locked again afterwards
+
+    Args:
+        attr_pairs (list(tuple(Attr, Attr))): (source attr, destination 
+        attr) pairs
+    """
+    pair_attrs = {attr for attr_pair in attr_pairs for attr in attr_pair}
+    locked_attrs = [attr for attr in pair_attrs if attr.is_locked()]
+    for attr in locked_attrs:
+        attr.set_locked(False)
+    try:
+        utils_om.connect_plug_pairs([(src.plug, dest.plug) for src, dest in attr_pairs])
+    finally:
+        for attr in locked_attrs:
+            attr.set_locked(True)
+
 class Node():
     """
     A Class encapsulating a node
@@ -59,9 +84,7 @@ class Node():
         return self._dep_node.uniqueName()
     @property 
     def name(self):
-        if self.full_name.find("|") != -1:
-            return self.full_name.rsplit("|", 1)[1]
-        return self.full_name
+        return self.full_name.rpartition("|")[2]
     @property
     def node_type(self):
         return self._dep_node.typeName
@@ -72,6 +95,10 @@ class Node():
     
 
     def has_attr(self, attr_name):
+        # plain attribute names can be answered by the node without
+        # resolving a plug
+        if isinstance(attr_name, str) and self._dep_node.hasAttribute(attr_name):
+            return True
         try:
             self.__getitem__(attr_name)
             return True
@@ -82,30 +109,19 @@ class Node():
         return cmds.objExists(str(self))
 
     def add_attr(self, long_name="", **kwargs):
-        if "parent" in kwargs.keys():
-            if isinstance(kwargs["parent"], Attr):
-                kwargs["parent"] = kwargs["parent"].attr_name
-            else:
-                kwargs["parent"] = str(kwargs["parent"])
-
-        attr_type=""
-        if "type" in kwargs.keys():
-            attr_type=kwargs["type"]
-            kwargs.pop("type")
-        if "longName" in kwargs.keys():
-            kwargs.pop("longName")
-        
-        # dataType attribute
-        if attr_type in ["string", "nurbsCurve", "nurbsSurface", "mesh", "matrix"]:
-            kwargs["dataType"] = attr_type
+        if "parent" in kwargs:
+            parent = kwargs["parent"]
+            kwargs["parent"] = parent.attr_name if isinstance(parent, Attr) else str(parent)
 
-        # attributeType attribute
-        elif attr_type in ["compound", "message", "double", "long", "bool", "enum", "double3", "double2"]:
-            kwargs["attributeType"] = attr_type
+        attr_type = kwargs.pop("type", "")
+        kwargs.pop("longName", None)
+        
+        # dataType or attributeType attribute
+        type_flag = ADD_ATTR_TYPE_FLAGS.get(attr_type)
+        if type_flag is not None:
+            kwargs[type_flag] = attr_type
 
-        new_kwargs = {}
-        for key in kwargs:
-            new_kwargs[snake_to_camel(key)] = kwargs[key]
+        new_kwargs = {snake_to_camel(key): value for key, value in kwargs.items()}
 
         cmds.addAttr(str(self), longName=long_name, **new_kwargs)
         
@@ -113,25 +129,34 @@ class Node():
     def delete_attr(self, attr):
         cmds.deleteAttr(str(self), at=attr)
 
+        # drop cached wrappers of the attr and its children/elements
+        attr_prefixes = (f"{attr}.", f"{attr}[")
+        for key in [key for key in self.__attr_cache if key == attr or key.startswith(attr_prefixes)]:
+            del self.__attr_cache[key]
+        self.__full_attr_list = None
+
     def get_connection_list(self, as_src, as_dest):
         connections = set()
-        if as_src:
-            connection_list = cmds.listConnections(str(self), connections=True, source=True, destination=False, plugs=True)
-            if connection_list is not None:
-                connection_list = [(Attr(None, x), Attr(self, y)) for x, y in zip(connection_list[1::2], connection_list[::2])]
-                connections.update(connection_list)
-        if as_dest:
-            connection_list = cmds.listConnections(str(self), connections=True, source=False, destination=True, plugs=True)
-            if connection_list is not None:
-                connection_list = [(Attr(self, x), Attr(None, y)) for x, y in zip(connection_list[::2], connection_list[1::2])]
-                connections.update(connection_list)
+        # one api walk over the node's connected plugs instead of a 
+        # listConnections query per direction
+        for plug in self._dep_node.getConnections():
+            self_attr = Attr(self, plug)
+            if as_src:
+                connections.update((Attr(None, x), self_attr) for x in plug.connectedTo(True, False))
+            if as_dest:
+                connections.update((self_attr, Attr(None, x)) for x in plug.connectedTo(False, True))
+        # nothing to filter
+        if len(connections) == 0:
+            return []
+        published_attrs = set()
         if self.node_type == "container":
             self_container = Container(self)
-            published_attrs = self_container.get_published_attrs()
+            published_attrs = set(self_container.get_published_attrs())
 
-            connections = [x for x in connections if x[0] not in published_attrs and x[1] not in published_attrs]
-        connections = [x for x in connections if x[0].node.node_type != "hyperLayout" and x[1].node.node_type != "hyperLayout"]
-        return connections
+        # single pass filtering published attrs and hyperLayout nodes
+        return [(src, dest) for src, dest in connections
+                if src not in published_attrs and dest not in published_attrs
+                and src.node.node_type != "hyperLayout" and dest.node.node_type != "hyperLayout"]
 
     def _check_node_in_attr_list(self, attribute_list):
         if attribute_list:
@@ -145,12 +170,13 @@ class Node():
         """
         if not self.obj_exists():
             return
+        self_name = str(self)
         if not clean:
-            cmds.delete(str(self))
+            cmds.delete(self_name)
 
         # delete history
-        cmds.delete(str(self), constructionHistory=True)
-        children = cmds.listRelatives(str(self), allDescendents=True)
+        cmds.delete(self_name, constructionHistory=True)
+        children = cmds.listRelatives(self_name, allDescendents=True)
 
         all_children = [self]
         if children is not None:
@@ -159,10 +185,10 @@ class Node():
         # unpublish
         node_container = self.get_container_node()
         if node_container is not None:
-            publish_attrs = node_container.get_published_attrs()
-            filter_publish_attrs = [x for x in publish_attrs if x.node == self]
-            for attr in filter_publish_attrs:
-                node_container.unpublish_attr(attr)
+            self_mobject = self.mobject
+            for attr in node_container.get_published_attrs():
+                if attr.node.mobject == self_mobject:
+                    node_container.unpublish_attr(attr)
 
         # loop from child to parent
         for node in all_children[::-1]:
@@ -196,13 +222,10 @@ class Node():
             list(Attr):
         """
         if self.__full_attr_list is None or reCache:
-            attr_count = self._dep_node.attributeCount()
-            attributes = [self._dep_node.attribute(x) for x in range(attr_count)]
-            self.__full_attr_list = [Attr(self, self._dep_node.findPlug(x, False)) for x in attributes]
+            dep_node = self._dep_node
+            self.__full_attr_list = [Attr(self, dep_node.findPlug(dep_node.attribute(x), False)) for x in range(dep_node.attributeCount())]
 
-            for attr in self.__full_attr_list:
-                attr_name = attr.attr_name
-                self.__attr_cache[attr_name] = attr
+            self.__attr_cache.update((attr.attr_name, attr) for attr in self.__full_attr_list)
 
         return self.__full_attr_list
     
@@ -279,10 +302,11 @@ class Node():
         Returns:
             Attr: returns Attr class of nodes attribute
         """
-        if attr not in self.__attr_cache.keys():
-            self.__attr_cache[attr] = Attr(self, utils_om.get_plug(
-                self._dep_node, attr))
-        return self.__attr_cache[attr]
+        cached_attr = self.__attr_cache.get(attr)
+        if cached_attr is None:
+            cached_attr = Attr(self, utils_om.get_plug(self._dep_node, attr))
+            self.__attr_cache[attr] = cached_attr
+        return cached_attr
     
     def __eq__(self, other):
         """Returns True if the other object is of type Node and the 
@@ -295,8 +319,7 @@ class Node():
             bool: 
         """
         if isinstance(other, Node):
-            if str(self) == str(other):
-                return True
+            return self.mobject == other.mobject
             
         return False
     def __hash__(self):
@@ -311,33 +334,26 @@ class Container(Node):
         if child_nodes:
             return [Node(x) for x in child_nodes]
 
+    def _get_ancestor_container_names(self):
+        # chase parent containers by name so nothing is wrapped
+        container_names = [str(self)]
+        parent_containers = cmds.container(container_names[-1], query=True, parentContainer=True)
+        while parent_containers is not None:
+            container_names.append(parent_containers[0])
+            parent_containers = cmds.container(container_names[-1], query=True, parentContainer=True)
+        return container_names
+
     def lock(self, proprigate=False):
-        if proprigate:
-            container_list = []
-            current_container = self
-            while current_container is not None:
-                container_list.append(current_container)
-                current_container = current_container.get_container_node()
-        else:
-            container_list = [self]
+        container_names = self._get_ancestor_container_names() if proprigate else [str(self)]
 
-        for container in container_list:
-            cmds.lockNode(str(container), lock=True, lockUnpublished=True)
+        for container_name in container_names:
+            cmds.lockNode(container_name, lock=True, lockUnpublished=True)
 
     def unlock(self, proprigate=False):
-        if proprigate:
-            container_list = []
-            current_container = self
-            while current_container is not None:
-                container_list.append(current_container)
-                current_container = current_container.get_container_node()
-
-        else:
-            container_list = [self]
+        container_names = self._get_ancestor_container_names() if proprigate else [str(self)]
 
-        container_list = container_list[::-1]
-        for container in container_list:
-            cmds.lockNode(str(container), lock=False, lockUnpublished=False)
+        for container_name in container_names[::-1]:
+            cmds.lockNode(container_name, lock=False, lockUnpublished=False)
 
     def __enter__(self):
         self.unlock()
@@ -348,12 +364,11 @@ class Container(Node):
 
     def add_nodes(self, *args, include_network=False, include_hierarchy_above=False, include_hierarchy_below=False, force=False):
         args = [str(x) for x in args]
-        conversionNodes = []
-        for node in args:
-            node_conversionNodes = cmds.listConnections(node, source=True, destination=True)
-            node_conversionNodes = cmds.ls(node_conversionNodes, type='unitConversion')
-            conversionNodes.extend(node_conversionNodes)
-        args.extend(conversionNodes)
+        if args:
+            # one query for the conversion nodes connected to any of the nodes
+            conversionNodes = cmds.listConnections(args, source=True, destination=True, type='unitConversion')
+            if conversionNodes:
+                args.extend(conversionNodes)
         cmds.container(str(self), addNode=args, edit=True, iha=include_hierarchy_above, ihb=include_hierarchy_below, inc=include_network, force=force)
 
     def get_container_node(self):
@@ -372,7 +387,9 @@ class Container(Node):
         cmds.container(str(self), edit=True, removeNode=remove_list, force=True)
 
     def publish_attr(self, attr, attr_bind_name:str):
-        if attr.node in self.get_nodes():
+        # ask for the attr node's container instead of wrapping every 
+        # node in this container
+        if attr.node.get_container_node() == self:
             cmds.container(str(self), edit=True, publishAndBind=[str(attr), attr_bind_name])
         else:
             raise RuntimeError(f"{attr.node} is not a node of container {str(self)}")
@@ -398,63 +415,77 @@ class Container(Node):
         return []
 
     def get_external_connection_list(self):
-        container_nodes = self.get_nodes()
         connection_list = []
 
         external_connection_list = cmds.container(str(self), query=True, connectionList=True)
         if external_connection_list is None:
-            external_connection_list = []
+            return connection_list
+        # set for constant time membership checks per connection
+        container_nodes = set(self.get_nodes() or [])
+        compound_types = ("compound", "double3", "double2")
         for attr in external_connection_list:
             curr_attr = Attr(None, attr)
 
-            if curr_attr.attr_type not in ["compound", "double3", "double2"] and curr_attr.__len__() is not None:
+            if curr_attr.attr_type not in compound_types and curr_attr.__len__() is not None:
                 curr_attr = curr_attr[0]
 
-            input_connections = curr_attr.get_src_connections()
-            output_connections = curr_attr.get_dest_connections()
-            for input in input_connections:
+            for input in curr_attr.get_src_connections():
                 if input.node in container_nodes:
                     connection_list.append((input, curr_attr))
-            for output in output_connections:
+            for output in curr_attr.get_dest_connections():
                 if output.node in container_nodes:
                     connection_list.append((curr_attr, output))
         return connection_list
 
+    @staticmethod
+    def _get_child_container_names(container_name:str):
+        child_nodes = cmds.container(container_name, query=True, nodeList=True)
+        if child_nodes:
+            return cmds.ls(child_nodes, type="container")
+        return []
+
+    def iter_child_containers(self):
+        """yields every container nested under this container depth 
+        first without building the full list
+
+        Yields:
+            Container:
+        """
+        container_stack = self._get_child_container_names(str(self))[::-1]
+        while container_stack:
+            container_name = container_stack.pop()
+            yield Container(container_name)
+            container_stack.extend(self._get_child_container_names(container_name)[::-1])
+
     def get_child_containers(self, all=False):
-        sub_containers = [x for x in self.get_nodes() if x.node_type == "container"]
-        return_child_containers = []
-        if not all:
-            return sub_containers
-        for container in sub_containers:
-            container = Container(container)
-            return_child_containers.append(container)
-            return_child_containers.extend(container.get_child_containers(all=all))
-        return return_child_containers
+        if all:
+            return list(self.iter_child_containers())
+        # filter by type on the raw names so only containers get wrapped
+        return [Container(x) for x in self._get_child_container_names(str(self))]
 
     def __setitem__(self, attr: str, new_value):
-        publish_attr_map = self.get_published_attr_map()
-        if attr in publish_attr_map.keys():
-            attr = publish_attr_map[attr]
-            attr.set(new_value)
+        published_attr = self.get_published_attr_map().get(attr)
+        if published_attr is not None:
+            published_attr.set(new_value)
         else:
             super().__setitem__(attr, new_value)
 
     def __getitem__(self, attr: str):
         publish_attr_map = self.get_published_attr_map()
-        if attr in publish_attr_map.keys():
+        if attr in publish_attr_map:
             return publish_attr_map[attr]
         if attr.find("[") != -1 or attr.find(".") != -1:
             if attr.find("[") != -1:
                 parent_attr, back_attrs = attr.split("[", 1)
                 index, back_attrs = back_attrs.split("]", 1)
-                if parent_attr in publish_attr_map.keys():
+                if parent_attr in publish_attr_map:
                     return_attr = publish_attr_map[parent_attr][int(index)]
                     if back_attrs != "":
                         return return_attr[back_attrs]
                     return return_attr
             else:
                 parent_attr, back_attrs = attr.split(".", 1)
-                if parent_attr in publish_attr_map.keys():
+                if parent_attr in publish_attr_map:
                     return publish_attr_map[parent_attr][back_attrs]
         return super().__getitem__(attr)
     
@@ -616,11 +647,9 @@ class Attr():
             return self.plug.logicalIndex()
         elif self.plug.isChild:
             parent_plug = self.plug.parent()
-            child_plug_list = [parent_plug.child(x) for x in 
-                               range(parent_plug.numChildren())]
-            child_attr_dict = {x.name().split(".", 1)[1]: i for i, x in 
-                               enumerate(child_plug_list)}
-            return child_attr_dict[self.attr_name]
+            for index in range(parent_plug.numChildren()):
+                if parent_plug.child(index).attribute() == self.plug.attribute():
+                    return index
         return -1
     @property
     def parent(self):
@@ -692,17 +721,14 @@ class Attr():
             self.set_locked(True)
     
     def has_source_connection(self):
-        if len(self.get_src_connections()) == []:
-            return False
-        return True
+        return self.plug.isDestination
 
     def get_plug(self):
         return self.plug
     
     def is_connected(self, as_src=False, as_dest=True):
-        if self.get_connections(as_src, as_dest) == []:
-            return False
-        return True
+        # check the raw plugs so no Attr is built for each connection
+        return len(self.plug.connectedTo(as_dest, as_src)) > 0
 
     def get_connections(self, as_src: bool, as_dest: bool):
         """Get connections of attr
@@ -730,6 +756,21 @@ class Attr():
             list(Attr): 
         """
         return self.get_connections(True, False)
+    def get_first_connection(self, as_src: bool, as_dest: bool):
+        """Gets the first connection of attr without wrapping every 
+        connected plug
+
+        Args:
+            as_src (bool): get connections with attr as source
+            as_dest (bool): get connections with attr as destination
+
+        Returns:
+            Attr: returns None if there are no connections
+        """
+        connected_plugs = self.plug.connectedTo(as_dest, as_src)
+        if len(connected_plugs) == 0:
+            return None
+        return Attr(None, connected_plugs[0])
     # functions
     def set(self, value):
         """Tries to set value of plug but resets to previous values if 
@@ -811,19 +852,20 @@ class Attr():
         elif attr_type == "matrix":
             cmds.setAttr(str(self), value, type='matrix')
         elif attr_type == "enum":
-            if not hasattr(self, "enum_list"):
-                self.enum_list = cmds.addAttr(str(self), query=True, enumName=True).split(":")
-            
+            # queried per set, cached wrappers would otherwise keep old enum names
             if isinstance(value, str):
-                index = self.enum_list.index(value)
+                enum_list = cmds.addAttr(str(self), query=True, enumName=True).split(":")
+                index = enum_list.index(value)
                 if index != -1:
                     value = index
             cmds.setAttr(str(self), value)
 
-        elif self._plug_attr_type(plug) in self.__attr_data_map__.keys():
-            self.__attr_data_map__[self._plug_attr_type(plug)]["set"](plug, value)
         else:
-            cmds.setAttr(str(self), value)
+            attr_data = self.__attr_data_map__.get(self._plug_attr_type(plug))
+            if attr_data is not None:
+                attr_data["set"](plug, value)
+            else:
+                cmds.setAttr(str(self), value)
 
         if locked:
             self.set_locked(True)
@@ -846,8 +888,9 @@ class Attr():
             plug_list = [plug.child(i) for i in range(plug.numChildren())]
             plug_list = [self._get_value(x) for x in plug_list]
             return tuple(plug_list)
-        elif self._plug_attr_type(plug) in self.__attr_data_map__.keys():
-            return self.__attr_data_map__[self._plug_attr_type(plug)]["get"](plug)
+        attr_data = self.__attr_data_map__.get(self._plug_attr_type(plug))
+        if attr_data is not None:
+            return attr_data["get"](plug)
         # else:
             # attr_type = cmds.getAttr(str(self), type=True)
         return_value = cmds.getAttr(str(self))
@@ -865,7 +908,7 @@ class Attr():
             bool: 
         """
         if isinstance(other, Attr):
-            return str(self) == str(other)
+            return self.plug == other.plug
         return False
     
     def __hash__(self):
@@ -942,18 +985,35 @@ class Attr():
         Returns:
             Attr:
         """
-        full_attr_name = self.attr_name
         try:
-            if self.plug.isArray:
-                full_attr_name = f"{full_attr_name}[{attr}]"
-            elif self.plug.isCompound:
-                full_attr_name = f"{full_attr_name}.{attr}"
-
-            if full_attr_name in self.node.get_attr_cache().keys():
-                return self.node.get_attr_cache()[full_attr_name]
+            # only single element or child lookups are cached, paths such
+            # as ".child" or "[0].child" would give malformed keys
+            full_attr_name = None
+            if isinstance(attr, int) or not any(char in attr for char in ".[]"):
+                if self.plug.isArray:
+                    full_attr_name = f"{self.attr_name}[{attr}]"
+                elif self.plug.isCompound and isinstance(attr, str):
+                    full_attr_name = f"{self.attr_name}.{attr}"
+
+            attr_cache = self.node.get_attr_cache()
+            if full_attr_name is not None:
+                cached_attr = attr_cache.get(full_attr_name)
+                if cached_attr is not None:
+                    return cached_attr
+
+            # integer index fast path, skips parsing attr as a path
+            if isinstance(attr, int):
+                if self.plug.isArray:
+                    plug = self.plug.elementByLogicalIndex(attr)
+                else:
+                    plug = self.plug.child(attr)
+            else:
+                plug = utils_om.get_plug(self.plug, attr)
 
-            plug = utils_om.get_plug(self.plug, attr)
-            return Attr(self.node, plug)
+            child_attr = Attr(self.node, plug)
+            if full_attr_name is not None:
+                attr_cache[full_attr_name] = child_attr
+            return child_attr
         except:
             error_str = f"{self.node} does not have attribute \"{self.attr_short_name}.{attr}\""
             raise RuntimeError(error_str)
@@ -55,12 +55,15 @@ def get_child_plug(plug: om2.MPlug, attr: str):
     Returns:
         Union[om2.MPlug, dict{str, om2.MPlug}: child MPlug
     """
-    child_plugs = [plug.child(index) for index in range(plug.numChildren())]
-    child_plugs = {x.name().rsplit(".", 1)[1]: x for x in child_plugs}
     if attr == None:
-        return child_plugs
-    if attr in child_plugs.keys():
-        return child_plugs[attr]
+        child_plugs = [plug.child(index) for index in range(plug.numChildren())]
+        return {x.name().rsplit(".", 1)[1]: x for x in child_plugs}
+
+    # stop at the first matching child instead of naming every child
+    for index in range(plug.numChildren()):
+        child_plug = plug.child(index)
+        if child_plug.name().rsplit(".", 1)[1] == attr:
+            return child_plug
     return None
 
 def get_plug(attr_parent: Union[om2.MPlug, om2.MFnDependencyNode, str],
@@ -132,4 +135,57 @@ def connect_plugs(src_plug: om2.MPlug, dest_plug: om2.MPlug):
                 undo = lambda: undo(src_plug, dest_plug)
             )
         except:
-            cmds.connectAttr(str(src_plug), str(dest_plug), force=True)
\ No newline at end of file
+            cmds.connectAttr(str(src_plug), str(dest_plug), force=True)
+
+def connect_plug_pairs(plug_pairs: list):
+        """connects every source plug to its destination plug with a 
+        single MDGModifier
+
+        Args:
+            plug_pairs (list(tuple(om2.MPlug, om2.MPlug))): (source 
+            plug, destination plug) pairs
+        """
+        def redo(plug_pairs):
+            dgMod = om2.MDGModifier()
+            for src_plug, dest_plug in plug_pairs:
+                dgMod.connect(src_plug, dest_plug)
+            dgMod.doIt()
+        def undo(plug_pairs):
+            dgMod = om2.MDGModifier()
+            for src_plug, dest_plug in plug_pairs:
+                dgMod.disconnect(src_plug, dest_plug)
+            dgMod.doIt()
+        if len(plug_pairs) == 0:
+            return
+        try:
+            redo(plug_pairs)
+            apiundo.commit(
+                redo = lambda: redo(plug_pairs),
+                undo = lambda: undo(plug_pairs)
+            )
+        except:
+            # doIt can fail partway. keep the undo for the pairs it did
+            # connect and only fall back to connectAttr for the rest
+            connected_pairs = []
+            for src_plug, dest_plug in plug_pairs:
+                if is_plug_connected(src_plug, dest_plug):
+                    connected_pairs.append((src_plug, dest_plug))
+                else:
+                    cmds.connectAttr(str(src_plug), str(dest_plug), force=True)
+            if connected_pairs:
+                apiundo.commit(
+                    redo = lambda: redo(connected_pairs),
+                    undo = lambda: undo(connected_pairs)
+                )
+
+def is_plug_connected(src_plug: om2.MPlug, dest_plug: om2.MPlug):
+        """checks if source plug is connected directly to destination plug
+
+        Args:
+            src_plug (om2.MPlug):
+            dest_plug (om2.MPlug):
+
+        Returns:
+            bool:
+        """
+        return any(x == src_plug for x in dest_plug.connectedTo(True, False))
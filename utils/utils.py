@@ -1,6 +1,7 @@
 import inspect
 import maya.cmds as cmds
 import re
+import string
 
 def camel_to_snake(camel_str):
     # Find all instances where a lowercase letter is followed by an uppercase letter
@@ -34,18 +35,18 @@ def map_to_container(node:nw.Node, node_message_name, container_message_name="co
 
 def get_first_connected_node(attr:nw.Attr, as_source=True, as_dest=True) -> nw.Node:
     
-    connection_list = attr.get_connections(as_src=as_source, as_dest=as_dest)
-    if len(connection_list) == 0:
+    connection = attr.get_first_connection(as_src=as_source, as_dest=as_dest)
+    if connection is None:
         return None
     
-    return connection_list[0].node
+    return connection.node
 
 def get_classes_from_package(package, excluded_classes:list=[]):
     module_classes = [name for name, obj in inspect.getmembers(package) if inspect.isclass(obj) and name not in excluded_classes]
     return module_classes
 
 def strip_trailing_numbers(input_string):
-    return re.sub(r'\d+$', '', input_string)
+    return input_string.rstrip(string.digits)
 
 def get_trailing_numbers(input_string):
     match = re.search(r'\d+$', input_string)
@@ -55,11 +56,8 @@ def get_trailing_numbers(input_string):
         return ""
     
 def get_max_trailing_numbers(input_str_list):
-    input_str_list = [get_trailing_numbers(x) for x in input_str_list]
-    input_str_list = [float(x) for x in input_str_list if x != ""]
-    if input_str_list == []:
-        return 0
-    return max(input_str_list)
+    trailing_numbers = (get_trailing_numbers(x) for x in input_str_list)
+    return max((float(x) for x in trailing_numbers if x != ""), default=0)
 
 def class_type_to_str(class_type):
     if not isinstance(class_type, type) and not re.search(r"<class\s+'([^']*)'>", str(class_type)):
@@ -72,10 +70,19 @@ def class_type_to_str(class_type):
         return match.group(1)
     else:
         return ""
+
+# class str -> class, only resolved classes are kept so a class whose
+# module is imported later is still found
+_string_to_class_cache = {}
+
 def string_to_class(class_str):
     if re.search(r"<class\s+'([^']*)'>", str(class_str)):
         class_str = class_type_to_str(class_str)
 
+    cached_class = _string_to_class_cache.get(class_str)
+    if cached_class is not None:
+        return cached_class
+
     module_list = class_str.split(".")
 
     mod = __import__(module_list[0], {}, {}, [module_list[0]])
@@ -86,6 +93,7 @@ def string_to_class(class_str):
             mod = getattr(mod, module)
         else:
             return None
+    _string_to_class_cache[class_str] = mod
     return mod
 
 def kwarg_to_dict(**kwargs):
@@ -125,11 +133,11 @@ class Namespace:
         
     @classmethod
     def strip_outer_colons(cls, namespace):
-        return re.sub(r'^:+|:+$', '', namespace)
+        return namespace.strip(":")
     
     @classmethod
     def add_outer_colons(cls, namespace):
-        return ":{}:".format(re.sub(r'^:+|:+$', '', namespace))
+        return ":{}:".format(namespace.strip(":"))
     
     @classmethod
     def add_namespace(cls, namespace):
@@ -149,14 +157,9 @@ class Namespace:
 
     @classmethod
     def empty(cls, namespace):
-        cmds.namespace(setNamespace=namespace)
-        child_nodes = cmds.namespaceInfo(listOnlyDependencyNodes=True)
-        child_namespaces = cmds.namespaceInfo(listOnlyNamespaces=True)
-        cmds.namespace(setNamespace=":")
-
-        if child_nodes is None and child_namespaces is None:
-            return True
-        return False
+        # lists nodes and child namespaces together without changing 
+        # the current namespace
+        return not cmds.namespaceInfo(namespace, listNamespace=True)
     
     @classmethod
     def equal_namespace(cls, namespace1, namespace2):